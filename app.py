@@ -1,6 +1,9 @@
 """
 TalentScout Hiring Assistant Chatbot - Main Streamlit Application
 """
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, Optional
 import streamlit as st
 from config.settings import (
     ConversationStage,
@@ -14,6 +17,7 @@ from utils.llm_handler import LLMHandler
 from utils.validators import Validator
 from utils.ui_components import (
     display_chat_message,
+    display_chat_history,
     display_sidebar_info,
     display_progress_indicator,
     apply_custom_css,
@@ -35,6 +39,22 @@ except Exception:
     # Page config already set, ignore
     pass
 
+
+@st.cache_resource
+def get_llm_handler() -> LLMHandler:
+    """Create the LLM handler once and share it across sessions."""
+    handler = LLMHandler()
+    # Open the API connection in the background so the first reply doesn't pay for it
+    threading.Thread(target=handler.warm_up, daemon=True).start()
+    return handler
+
+
+@st.cache_resource
+def _get_executor() -> ThreadPoolExecutor:
+    """Shared worker pool for background LLM calls."""
+    return ThreadPoolExecutor(max_workers=2)
+
+
 # Apply custom CSS
 apply_custom_css()
 
@@ -42,12 +62,12 @@ apply_custom_css()
 if "conversation_manager" not in st.session_state:
     st.session_state.conversation_manager = ConversationManager()
 
-if "llm_handler" not in st.session_state:
-    try:
-        st.session_state.llm_handler = LLMHandler()
-    except Exception as e:
-        st.error(f"Failed to initialize LLM handler: {str(e)}")
-        st.stop()
+# LLM handler (shared across sessions; its connection warms up while the page renders)
+try:
+    st.session_state.llm_handler = get_llm_handler()
+except Exception as e:
+    st.error(f"Failed to initialize LLM handler: {str(e)}")
+    st.stop()
 
 if "messages" not in st.session_state:
     st.session_state.messages = []
@@ -61,23 +81,51 @@ if "awaiting_answer" not in st.session_state:
 if "current_question" not in st.session_state:
     st.session_state.current_question = None
 
+if "prefetched_question" not in st.session_state:
+    st.session_state.prefetched_question = None
+
 
 def initialize_conversation():
     """Initialize conversation with greeting."""
     if not st.session_state.initialized:
         try:
+            cm = st.session_state.conversation_manager
             greeting = st.session_state.llm_handler.generate_greeting()
-            st.session_state.conversation_manager.add_message("assistant", greeting)
+            cm.add_message("assistant", greeting)
             st.session_state.messages.append({
                 "role": "assistant",
                 "content": greeting,
-                "timestamp": st.session_state.conversation_manager.conversation_history[-1]["timestamp"]
+                "timestamp": cm.conversation_history[-1]["timestamp"]
             })
             st.session_state.initialized = True
         except Exception as e:
             display_error_message(f"Failed to generate greeting: {str(e)}")
 
 
+# Candidate info field collected at each stage
+_STAGE_FIELD = {
+    ConversationStage.COLLECT_NAME: "name",
+    ConversationStage.COLLECT_EMAIL: "email",
+    ConversationStage.COLLECT_PHONE: "phone",
+    ConversationStage.COLLECT_EXPERIENCE: "experience",
+    ConversationStage.COLLECT_POSITION: "position",
+    ConversationStage.COLLECT_LOCATION: "location",
+    ConversationStage.COLLECT_TECH_STACK: "tech_stack"
+}
+
+# Validator dispatch table for information collection stages
+_VALIDATOR = Validator()
+_STAGE_VALIDATORS = {
+    ConversationStage.COLLECT_NAME: _VALIDATOR.validate_name,
+    ConversationStage.COLLECT_EMAIL: _VALIDATOR.validate_email,
+    ConversationStage.COLLECT_PHONE: _VALIDATOR.validate_phone,
+    ConversationStage.COLLECT_EXPERIENCE: _VALIDATOR.validate_experience,
+    ConversationStage.COLLECT_POSITION: _VALIDATOR.validate_position,
+    ConversationStage.COLLECT_LOCATION: _VALIDATOR.validate_location,
+    ConversationStage.COLLECT_TECH_STACK: _VALIDATOR.validate_tech_stack
+}
+
+
 def validate_and_process_input(user_input: str) -> tuple:
     """
     Validate user input based on current stage and process it.
@@ -86,37 +134,13 @@ def validate_and_process_input(user_input: str) -> tuple:
         Tuple of (is_valid, processed_value, error_message)
     """
     stage = st.session_state.conversation_manager.stage
-    validator = Validator()
-    
-    if stage == ConversationStage.COLLECT_NAME:
-        is_valid, result = validator.validate_name(user_input)
-        return is_valid, result, "" if is_valid else result
     
-    elif stage == ConversationStage.COLLECT_EMAIL:
-        is_valid, result = validator.validate_email(user_input)
+    validate = _STAGE_VALIDATORS.get(stage)
+    if validate:
+        is_valid, result = validate(user_input)
         return is_valid, result, "" if is_valid else result
     
-    elif stage == ConversationStage.COLLECT_PHONE:
-        is_valid, result = validator.validate_phone(user_input)
-        return is_valid, result, "" if is_valid else result
-    
-    elif stage == ConversationStage.COLLECT_EXPERIENCE:
-        is_valid, result = validator.validate_experience(user_input)
-        return is_valid, result, "" if is_valid else result
-    
-    elif stage == ConversationStage.COLLECT_POSITION:
-        is_valid, result = validator.validate_position(user_input)
-        return is_valid, result, "" if is_valid else result
-    
-    elif stage == ConversationStage.COLLECT_LOCATION:
-        is_valid, result = validator.validate_location(user_input)
-        return is_valid, result, "" if is_valid else result
-    
-    elif stage == ConversationStage.COLLECT_TECH_STACK:
-        is_valid, result = validator.validate_tech_stack(user_input)
-        return is_valid, result, "" if is_valid else result
-    
-    elif stage == ConversationStage.TECHNICAL_QUESTIONS:
+    if stage is ConversationStage.TECHNICAL_QUESTIONS:
         # For technical questions, any non-empty input is valid
         if user_input.strip():
             return True, user_input.strip(), ""
@@ -127,16 +151,88 @@ def validate_and_process_input(user_input: str) -> tuple:
 
 def get_field_name_for_stage(stage: ConversationStage) -> str:
     """Get field name for current stage."""
-    field_map = {
-        ConversationStage.COLLECT_NAME: "name",
-        ConversationStage.COLLECT_EMAIL: "email",
-        ConversationStage.COLLECT_PHONE: "phone",
-        ConversationStage.COLLECT_EXPERIENCE: "experience",
-        ConversationStage.COLLECT_POSITION: "position",
-        ConversationStage.COLLECT_LOCATION: "location",
-        ConversationStage.COLLECT_TECH_STACK: "tech_stack"
-    }
-    return field_map.get(stage, "")
+    return _STAGE_FIELD.get(stage, "")
+
+
+def _append_pair(user_text: str, bot_text: str) -> None:
+    """Mirror the last user/assistant exchange into the displayed messages."""
+    history = st.session_state.conversation_manager.conversation_history
+    assistant_entry = history[-1]
+    user_entry = history[-2] if len(history) >= 2 else assistant_entry
+    st.session_state.messages.extend((
+        {"role": "user", "content": user_text, "timestamp": user_entry["timestamp"]},
+        {"role": "assistant", "content": bot_text, "timestamp": assistant_entry["timestamp"]}
+    ))
+
+
+def _stream_reply(user_input: str, chunks: Iterator[str]) -> str:
+    """
+    Show the user's message and stream the assistant reply as it is generated.
+    
+    Returns:
+        The complete reply text
+    """
+    cm = st.session_state.conversation_manager
+    display_chat_message("user", user_input, cm.conversation_history[-1]["timestamp"])
+    with st.chat_message("assistant"):
+        reply = st.write_stream(chunks).strip()
+    cm.add_message("assistant", reply)
+    _append_pair(user_input, reply)
+    return reply
+
+
+def _prefetch_next_question(question_num: int, question: str) -> None:
+    """
+    Start generating the next technical question while the candidate answers.
+    
+    The candidate's answer to the current question isn't known yet, so the
+    prefetch sees the answered Q/A history and is told the current question
+    was already asked. The result is keyed on the question it followed and
+    only used for that question.
+    """
+    cm = st.session_state.conversation_manager
+    _discard_prefetched_question()
+    if question_num >= cm.total_questions_to_ask:
+        return
+    
+    tech_stack = cm.get_question_tech_stack()
+    key = (tech_stack, question_num + 1, cm.total_questions_to_ask, question)
+    future = _get_executor().submit(
+        st.session_state.llm_handler.complete_technical_question,
+        tech_stack=tech_stack,
+        question_number=question_num + 1,
+        num_questions=cm.total_questions_to_ask,
+        previous_qa=list(cm.tech_questions_answers),
+        messages=list(cm.tech_qa_messages),
+        pending_question=question
+    )
+    st.session_state.prefetched_question = (key, future)
+
+
+def _discard_prefetched_question() -> None:
+    """Cancel any pending prefetch so it doesn't occupy the shared workers."""
+    prefetched = st.session_state.prefetched_question
+    st.session_state.prefetched_question = None
+    if prefetched:
+        prefetched[1].cancel()
+
+
+def _take_prefetched_question(key: tuple) -> Optional[str]:
+    """
+    Return the prefetched question if it is ready and followed the question just answered.
+    
+    Returns:
+        The question, or None when it is stale, unfinished or failed
+    """
+    prefetched = st.session_state.prefetched_question
+    _discard_prefetched_question()
+    if not (prefetched and prefetched[0] == key and prefetched[1].done()):
+        return None
+    try:
+        return prefetched[1].result()
+    except Exception:
+        # Fall back to streaming a fresh question
+        return None
 
 
 def handle_user_message(user_input: str):
@@ -146,27 +242,14 @@ def handle_user_message(user_input: str):
     
     # Check for exit keywords
     if cm.check_exit_keyword(user_input):
-        exit_message = llm.generate_exit_message()
+        _discard_prefetched_question()
         cm.add_message("user", user_input)
-        cm.add_message("assistant", exit_message)
+        _stream_reply(user_input, llm.stream_exit_message())
         cm.stage = ConversationStage.ENDED
-        # Safely get timestamps - ensure we have at least 2 messages
-        user_ts = cm.conversation_history[-2]["timestamp"] if len(cm.conversation_history) >= 2 else cm.conversation_history[-1]["timestamp"]
-        assistant_ts = cm.conversation_history[-1]["timestamp"]
-        st.session_state.messages.append({
-            "role": "user",
-            "content": user_input,
-            "timestamp": user_ts
-        })
-        st.session_state.messages.append({
-            "role": "assistant",
-            "content": exit_message,
-            "timestamp": assistant_ts
-        })
         return
     
     # Handle different stages
-    if cm.stage == ConversationStage.TECHNICAL_QUESTIONS:
+    if cm.stage is ConversationStage.TECHNICAL_QUESTIONS:
         # Handle technical question answer
         if st.session_state.current_question:
             # Save answer
@@ -177,46 +260,27 @@ def handle_user_message(user_input: str):
             if cm.has_more_technical_questions():
                 # Generate next question
                 question_num = cm.get_current_question_number()
-                tech_stack = cm.candidate_info.get("tech_stack", "")
-                question = llm.generate_technical_question(
-                    tech_stack=tech_stack,
-                    question_number=question_num,
-                    num_questions=cm.total_questions_to_ask,
-                    previous_qa=cm.tech_questions_answers
+                tech_stack = cm.get_question_tech_stack()
+                question = _take_prefetched_question(
+                    (tech_stack, question_num, cm.total_questions_to_ask, st.session_state.current_question)
                 )
+                if question:
+                    cm.add_message("assistant", question)
+                    _append_pair(user_input, question)
+                else:
+                    question = _stream_reply(user_input, llm.stream_technical_question(
+                        tech_stack=tech_stack,
+                        question_number=question_num,
+                        num_questions=cm.total_questions_to_ask,
+                        previous_qa=cm.tech_questions_answers,
+                        messages=cm.tech_qa_messages
+                    ))
                 st.session_state.current_question = question
-                cm.add_message("assistant", question)
-                # Safely get timestamps
-                user_ts = cm.conversation_history[-2]["timestamp"] if len(cm.conversation_history) >= 2 else cm.conversation_history[-1]["timestamp"]
-                assistant_ts = cm.conversation_history[-1]["timestamp"]
-                st.session_state.messages.append({
-                    "role": "user",
-                    "content": user_input,
-                    "timestamp": user_ts
-                })
-                st.session_state.messages.append({
-                    "role": "assistant",
-                    "content": question,
-                    "timestamp": assistant_ts
-                })
+                _prefetch_next_question(question_num, question)
             else:
                 # All questions answered, move to conclusion
                 cm.move_to_next_stage()
-                conclusion = llm.generate_conclusion(cm.candidate_info)
-                cm.add_message("assistant", conclusion)
-                # Safely get timestamps
-                user_ts = cm.conversation_history[-2]["timestamp"] if len(cm.conversation_history) >= 2 else cm.conversation_history[-1]["timestamp"]
-                assistant_ts = cm.conversation_history[-1]["timestamp"]
-                st.session_state.messages.append({
-                    "role": "user",
-                    "content": user_input,
-                    "timestamp": user_ts
-                })
-                st.session_state.messages.append({
-                    "role": "assistant",
-                    "content": conclusion,
-                    "timestamp": assistant_ts
-                })
+                _stream_reply(user_input, llm.stream_conclusion(cm.candidate_info))
                 st.session_state.current_question = None
         return
     
@@ -228,19 +292,7 @@ def handle_user_message(user_input: str):
         cm.add_message("user", user_input)
         error_response = f"I'm sorry, but that doesn't seem right. {error_msg} Please try again."
         cm.add_message("assistant", error_response)
-        # Safely get timestamps
-        user_ts = cm.conversation_history[-2]["timestamp"] if len(cm.conversation_history) >= 2 else cm.conversation_history[-1]["timestamp"]
-        assistant_ts = cm.conversation_history[-1]["timestamp"]
-        st.session_state.messages.append({
-            "role": "user",
-            "content": user_input,
-            "timestamp": user_ts
-        })
-        st.session_state.messages.append({
-            "role": "assistant",
-            "content": error_response,
-            "timestamp": assistant_ts
-        })
+        _append_pair(user_input, error_response)
         return
     
     # Valid input - save and move to next stage
@@ -254,70 +306,29 @@ def handle_user_message(user_input: str):
     cm.move_to_next_stage()
     
     # Generate response for next stage
-    if cm.stage == ConversationStage.TECHNICAL_QUESTIONS:
+    if cm.stage is ConversationStage.TECHNICAL_QUESTIONS:
         # Generate first technical question
-        tech_stack = cm.candidate_info.get("tech_stack", "")
+        tech_stack = cm.get_question_tech_stack()
         question_num = 1
-        question = llm.generate_technical_question(
+        question = _stream_reply(user_input, llm.stream_technical_question(
             tech_stack=tech_stack,
             question_number=question_num,
             num_questions=cm.total_questions_to_ask,
             previous_qa=[]
-        )
+        ))
         st.session_state.current_question = question
-        cm.add_message("assistant", question)
-        # Safely get timestamps
-        user_ts = cm.conversation_history[-2]["timestamp"] if len(cm.conversation_history) >= 2 else cm.conversation_history[-1]["timestamp"]
-        assistant_ts = cm.conversation_history[-1]["timestamp"]
-        st.session_state.messages.append({
-            "role": "user",
-            "content": user_input,
-            "timestamp": user_ts
-        })
-        st.session_state.messages.append({
-            "role": "assistant",
-            "content": question,
-            "timestamp": assistant_ts
-        })
-    elif cm.stage == ConversationStage.CONCLUSION:
+        _prefetch_next_question(question_num, question)
+    elif cm.stage is ConversationStage.CONCLUSION:
         # Generate conclusion
-        conclusion = llm.generate_conclusion(cm.candidate_info)
-        cm.add_message("assistant", conclusion)
-        # Safely get timestamps
-        user_ts = cm.conversation_history[-2]["timestamp"] if len(cm.conversation_history) >= 2 else cm.conversation_history[-1]["timestamp"]
-        assistant_ts = cm.conversation_history[-1]["timestamp"]
-        st.session_state.messages.append({
-            "role": "user",
-            "content": user_input,
-            "timestamp": user_ts
-        })
-        st.session_state.messages.append({
-            "role": "assistant",
-            "content": conclusion,
-            "timestamp": assistant_ts
-        })
+        _stream_reply(user_input, llm.stream_conclusion(cm.candidate_info))
     else:
         # Generate response for next information collection stage
         stage_context = cm.get_stage_prompt_context()
-        response = llm.generate_info_collector_response(
+        _stream_reply(user_input, llm.stream_info_collector_response(
             stage=stage_context["stage"],
             user_message=user_input,
             collected_info=stage_context["collected_info"]
-        )
-        cm.add_message("assistant", response)
-        # Safely get timestamps
-        user_ts = cm.conversation_history[-2]["timestamp"] if len(cm.conversation_history) >= 2 else cm.conversation_history[-1]["timestamp"]
-        assistant_ts = cm.conversation_history[-1]["timestamp"]
-        st.session_state.messages.append({
-            "role": "user",
-            "content": user_input,
-            "timestamp": user_ts
-        })
-        st.session_state.messages.append({
-            "role": "assistant",
-            "content": response,
-            "timestamp": assistant_ts
-        })
+        ))
 
 
 # Sidebar
@@ -345,6 +356,7 @@ if create_reset_button():
     st.session_state.messages = []
     st.session_state.initialized = False
     st.session_state.current_question = None
+    _discard_prefetched_question()
     st.rerun()
 
 # Main chat interface
@@ -355,15 +367,10 @@ st.markdown("Welcome! I'm here to help you through our initial screening process
 initialize_conversation()
 
 # Display chat history
-for message in st.session_state.messages:
-    display_chat_message(
-        message["role"],
-        message["content"],
-        message.get("timestamp")
-    )
+display_chat_history(st.session_state.messages)
 
 # User input
-if st.session_state.conversation_manager.stage != ConversationStage.ENDED:
+if st.session_state.conversation_manager.stage is not ConversationStage.ENDED:
     user_input = st.chat_input("Type your message here...")
     
     if user_input:
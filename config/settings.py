@@ -2,8 +2,11 @@
 Application settings and configuration constants.
 """
 import os
+import re
 import streamlit as st
 from enum import Enum
+from functools import lru_cache
+from itertools import chain
 from typing import Dict, List
 
 
@@ -23,7 +26,16 @@ class ConversationStage(Enum):
 
 
 # Exit keywords that will end the conversation
-EXIT_KEYWORDS = ["exit", "quit", "bye", "goodbye", "stop", "end", "cancel", "terminate"]
+EXIT_KEYWORDS = frozenset({"exit", "quit", "bye", "goodbye", "stop", "end", "cancel", "terminate"})
+
+# Precompiled whole-word matcher for exit keywords
+EXIT_PATTERN = re.compile(
+    r"\b(?:" + "|".join(map(re.escape, EXIT_KEYWORDS)) + r")\b",
+    re.IGNORECASE
+)
+
+# Number of most recent messages kept in conversation history
+MAX_LIVE_MESSAGES = 30
 
 # Stage sequence for conversation flow
 STAGE_SEQUENCE = [
@@ -79,16 +91,26 @@ SUPPORTED_TECH_STACKS = {
 }
 
 # Flatten tech stack list for easier searching
-ALL_TECH_STACKS = []
-for category, techs in SUPPORTED_TECH_STACKS.items():
-    ALL_TECH_STACKS.extend(techs)
+ALL_TECH_STACKS = tuple(chain.from_iterable(SUPPORTED_TECH_STACKS.values()))
+
+# Lowercase name -> canonical name, for case-insensitive tech lookups
+TECH_STACK_INDEX = {tech.lower(): tech for tech in ALL_TECH_STACKS}
 
 
+@lru_cache(maxsize=1)
 def get_api_key() -> str:
     """
     Get API key from Streamlit secrets or environment variables.
     Priority: Streamlit secrets > Environment variables
+
+    The result is cached for the process lifetime; call
+    ``get_api_key.cache_clear()`` to pick up rotated credentials.
     """
+    return _compute_api_key()
+
+
+def _compute_api_key() -> str:
+    """Resolve the API key without caching."""
     # Try Streamlit secrets first
     try:
         if hasattr(st, 'secrets'):
@@ -110,6 +132,7 @@ def get_api_key() -> str:
         return os.getenv("OPENAI_API_KEY", "")
 
 
+@lru_cache(maxsize=1)
 def get_llm_provider() -> str:
     """Get LLM provider from secrets or environment variables."""
     try:
@@ -123,6 +146,7 @@ def get_llm_provider() -> str:
     return os.getenv("LLM_PROVIDER", "openai").lower()
 
 
+@lru_cache(maxsize=1)
 def get_model_name() -> str:
     """Get model name from secrets or environment variables."""
     try:
@@ -142,6 +166,7 @@ def get_model_name() -> str:
         return os.getenv("MODEL_NAME", "gpt-3.5-turbo")
 
 
+@lru_cache(maxsize=1)
 def get_app_title() -> str:
     """Get app title from secrets or environment variables."""
     try:
@@ -155,6 +180,7 @@ def get_app_title() -> str:
     return os.getenv("APP_TITLE", "TalentScout Hiring Assistant")
 
 
+@lru_cache(maxsize=1)
 def get_company_name() -> str:
     """Get company name from secrets or environment variables."""
     try:
@@ -168,6 +194,7 @@ def get_company_name() -> str:
     return os.getenv("COMPANY_NAME", "TalentScout")
 
 
+@lru_cache(maxsize=1)
 def get_max_questions() -> int:
     """Get maximum number of technical questions."""
     try:
@@ -181,6 +208,7 @@ def get_max_questions() -> int:
     return int(os.getenv("MAX_QUESTIONS", "5"))
 
 
+@lru_cache(maxsize=1)
 def get_min_questions() -> int:
     """Get minimum number of technical questions."""
     try:
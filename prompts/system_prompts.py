@@ -1,9 +1,78 @@
 """
 System prompts for different conversation stages.
 """
-from config.settings import get_company_name
+from functools import lru_cache
+from typing import List, Optional, Tuple
+from config.settings import ConversationStage, get_company_name
 
 
+# Task instructions for each information collection stage
+_STAGE_INSTRUCTIONS = {
+    "collect_name": """TASK:
+- Ask for the candidate's full name
+- Validate: Name should be at least 2 characters and contain only letters, spaces, periods, hyphens, or apostrophes
+- If invalid, politely explain the requirement and ask again
+- Once valid, acknowledge and move to next step""",
+
+    "collect_email": """TASK:
+- Ask for the candidate's email address
+- Validate: Must be a proper email format (e.g., name@example.com)
+- If invalid, politely explain and ask for a valid email
+- Once valid, acknowledge and move to next step""",
+
+    "collect_phone": """TASK:
+- Ask for the candidate's phone number
+- Validate: Must be in international format with country code (e.g., +1 234 567 8900)
+- If invalid, politely explain the format requirement and ask again
+- Once valid, acknowledge and move to next step""",
+
+    "collect_experience": """TASK:
+- Ask for the candidate's years of experience
+- Accept formats like "3 years", "3", "three years", etc.
+- Validate: Must be between 0 and 50 years
+- If invalid, politely explain the range and ask again
+- Once valid, acknowledge and move to next step""",
+
+    "collect_position": """TASK:
+- Ask for the desired position(s) they're interested in
+- Accept single position or multiple positions
+- Validate: At least 3 characters
+- If invalid, politely ask for a more specific position name
+- Once valid, acknowledge and move to next step""",
+
+    "collect_location": """TASK:
+- Ask for the candidate's current location (city, state/country)
+- Validate: At least 2 characters
+- If invalid, politely ask for a more specific location
+- Once valid, acknowledge and move to next step""",
+
+    "collect_tech_stack": """TASK:
+- Ask for the candidate's tech stack (technologies they work with)
+- Accept comma-separated list (e.g., "Python, React, MongoDB")
+- Validate: At least 2 characters
+- If invalid, politely ask for at least one technology
+- Once valid, acknowledge and prepare for technical questions"""
+}
+
+# Display labels for candidate information fields
+_FIELD_LABELS = {
+    "name": "Full Name",
+    "email": "Email Address",
+    "phone": "Phone Number",
+    "experience": "Years of Experience",
+    "position": "Desired Position",
+    "location": "Current Location",
+    "tech_stack": "Tech Stack"
+}
+
+# Title-cased field names used in the information collector summary
+_TITLE_CACHE = {key: key.replace('_', ' ').title() for key in _FIELD_LABELS}
+
+# Display names for conversation stages
+_STAGE_DISPLAY = {stage.value: stage.value.replace('_', ' ').title() for stage in ConversationStage}
+
+
+@lru_cache(maxsize=1)
 def get_greeting_prompt() -> str:
     """Get the greeting prompt for initial conversation."""
     company_name = get_company_name()
@@ -41,59 +110,15 @@ def get_information_collector_prompt(stage: str, collected_info: dict) -> str:
     # Build context of collected information
     collected_summary = ""
     if collected_info:
-        collected_summary = "Information already collected:\n"
-        for key, value in collected_info.items():
-            if value:
-                collected_summary += f"- {key.replace('_', ' ').title()}: {value}\n"
-    
-    stage_instructions = {
-        "collect_name": """TASK:
-- Ask for the candidate's full name
-- Validate: Name should be at least 2 characters and contain only letters, spaces, periods, hyphens, or apostrophes
-- If invalid, politely explain the requirement and ask again
-- Once valid, acknowledge and move to next step""",
-        
-        "collect_email": """TASK:
-- Ask for the candidate's email address
-- Validate: Must be a proper email format (e.g., name@example.com)
-- If invalid, politely explain and ask for a valid email
-- Once valid, acknowledge and move to next step""",
-        
-        "collect_phone": """TASK:
-- Ask for the candidate's phone number
-- Validate: Must be in international format with country code (e.g., +1 234 567 8900)
-- If invalid, politely explain the format requirement and ask again
-- Once valid, acknowledge and move to next step""",
-        
-        "collect_experience": """TASK:
-- Ask for the candidate's years of experience
-- Accept formats like "3 years", "3", "three years", etc.
-- Validate: Must be between 0 and 50 years
-- If invalid, politely explain the range and ask again
-- Once valid, acknowledge and move to next step""",
-        
-        "collect_position": """TASK:
-- Ask for the desired position(s) they're interested in
-- Accept single position or multiple positions
-- Validate: At least 3 characters
-- If invalid, politely ask for a more specific position name
-- Once valid, acknowledge and move to next step""",
-        
-        "collect_location": """TASK:
-- Ask for the candidate's current location (city, state/country)
-- Validate: At least 2 characters
-- If invalid, politely ask for a more specific location
-- Once valid, acknowledge and move to next step""",
-        
-        "collect_tech_stack": """TASK:
-- Ask for the candidate's tech stack (technologies they work with)
-- Accept comma-separated list (e.g., "Python, React, MongoDB")
-- Validate: At least 2 characters
-- If invalid, politely ask for at least one technology
-- Once valid, acknowledge and prepare for technical questions"""
-    }
+        parts = ["Information already collected:"]
+        parts.extend(
+            f"- {_TITLE_CACHE.get(key) or key.replace('_', ' ').title()}: {value}"
+            for key, value in collected_info.items()
+            if value
+        )
+        collected_summary = "\n".join(parts) + "\n"
     
-    instruction = stage_instructions.get(stage, "Ask for the required information.")
+    instruction = _STAGE_INSTRUCTIONS.get(stage, "Ask for the required information.")
     
     return f"""You are a professional hiring assistant for {company_name}.
 
@@ -105,7 +130,7 @@ CRITICAL RULES:
 5. Do NOT ask for multiple pieces of information in one response
 6. Stay professional and friendly throughout
 
-CURRENT STAGE: {stage.replace('_', ' ').title()}
+CURRENT STAGE: {_STAGE_DISPLAY.get(stage) or stage.replace('_', ' ').title()}
 
 {collected_summary}
 
@@ -121,7 +146,8 @@ def get_tech_question_generator_prompt(
     tech_stack: str,
     question_number: int,
     num_questions: int,
-    previous_qa: list = None
+    previous_qa: Optional[List[Tuple[str, str]]] = None,
+    pending_question: Optional[str] = None
 ) -> str:
     """
     Get prompt for generating technical questions.
@@ -131,14 +157,17 @@ def get_tech_question_generator_prompt(
         question_number: Current question number (1-based)
         num_questions: Total number of questions to ask
         previous_qa: List of previous question-answer pairs
+        pending_question: Question already asked but not yet answered
     """
     company_name = get_company_name()
     
     previous_context = ""
     if previous_qa:
-        previous_context = "\nPrevious questions and answers:\n"
-        for i, (q, a) in enumerate(previous_qa, 1):
-            previous_context += f"Q{i}: {q}\nA{i}: {a}\n"
+        lines = ["", "Previous questions and answers:"]
+        lines.extend(f"Q{i}: {q}\nA{i}: {a}" for i, (q, a) in enumerate(previous_qa, 1))
+        previous_context = "\n".join(lines) + "\n"
+    if pending_question:
+        previous_context += f"\nAlready asked (do NOT repeat or rephrase it): {pending_question}\n"
     
     return f"""You are a technical interviewer for {company_name}.
 
@@ -180,7 +209,7 @@ def get_fallback_prompt(stage: str, needed_info: str = None) -> str:
 SITUATION:
 The user's message was unclear, off-topic, or didn't provide the needed information.
 
-CURRENT STAGE: {stage.replace('_', ' ').title()}
+CURRENT STAGE: {_STAGE_DISPLAY.get(stage) or stage.replace('_', ' ').title()}
 NEEDED INFORMATION: {needed_info or 'Not specified'}
 
 TASK:
@@ -208,20 +237,13 @@ def get_conclusion_prompt(collected_info: dict) -> str:
     # Format collected information summary
     info_summary = ""
     if collected_info:
-        info_summary = "\nCollected Information:\n"
-        field_labels = {
-            "name": "Full Name",
-            "email": "Email Address",
-            "phone": "Phone Number",
-            "experience": "Years of Experience",
-            "position": "Desired Position",
-            "location": "Current Location",
-            "tech_stack": "Tech Stack"
-        }
-        for key, value in collected_info.items():
-            if value:
-                label = field_labels.get(key, key.replace('_', ' ').title())
-                info_summary += f"- {label}: {value}\n"
+        parts = ["\nCollected Information:"]
+        parts.extend(
+            f"- {_FIELD_LABELS.get(key) or key.replace('_', ' ').title()}: {value}"
+            for key, value in collected_info.items()
+            if value
+        )
+        info_summary = "\n".join(parts) + "\n"
     
     return f"""You are a professional hiring assistant for {company_name}.
 
@@ -242,6 +264,7 @@ RESPONSE FORMAT:
 - Keep total response to 4-6 sentences"""
 
 
+@lru_cache(maxsize=1)
 def get_exit_prompt() -> str:
     """Get prompt for handling exit requests."""
     company_name = get_company_name()
@@ -264,3 +287,13 @@ RESPONSE FORMAT:
 - Keep total response to 3-4 sentences"""
 
 
+def clear_prompt_cache() -> None:
+    """
+    Clear the cached company name and every prompt rendered from it.
+    
+    Greeting and exit messages already generated from these prompts are
+    cached on the LLM handler; clear those with LLMHandler.clear_cached_messages.
+    """
+    get_company_name.cache_clear()
+    get_greeting_prompt.cache_clear()
+    get_exit_prompt.cache_clear()
@@ -2,6 +2,7 @@
 Setup verification script to check if all dependencies are installed correctly.
 """
 import sys
+from importlib.util import find_spec
 
 def check_python_version():
     """Check if Python version is 3.9 or higher."""
@@ -22,19 +23,14 @@ def check_dependencies():
         "phonenumbers",
     ]
     
-    missing_packages = []
+    # find_spec only locates each package; it doesn't execute its import-time code
+    missing_packages = [package for package in required_packages if find_spec(package) is None]
+    
     for package in required_packages:
-        try:
-            if package == "email_validator":
-                __import__("email_validator")
-            elif package == "phonenumbers":
-                __import__("phonenumbers")
-            else:
-                __import__(package)
-            print(f"✅ {package} is installed")
-        except ImportError:
+        if package in missing_packages:
             print(f"❌ {package} is NOT installed")
-            missing_packages.append(package)
+        else:
+            print(f"✅ {package} is installed")
     
     return len(missing_packages) == 0, missing_packages
 
@@ -73,9 +69,18 @@ def check_project_structure():
         "utils/validators.py",
     ]
     
+    # One directory listing per parent directory instead of one stat() per file
+    present_names = {}
+    for directory in {os.path.dirname(file_path) for file_path in required_files}:
+        try:
+            with os.scandir(directory or ".") as entries:
+                present_names[directory] = {entry.name for entry in entries if entry.is_file()}
+        except OSError:
+            present_names[directory] = set()
+    
     missing_files = []
     for file_path in required_files:
-        if os.path.exists(file_path):
+        if os.path.basename(file_path) in present_names[os.path.dirname(file_path)]:
             print(f"✅ {file_path} exists")
         else:
             print(f"❌ {file_path} is missing")
@@ -1,20 +1,57 @@
 """
 Conversation state management and stage tracking.
 """
+import random
+import time
+from collections import deque
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Deque, Dict, List, Optional, Tuple
 from config.settings import (
     ConversationStage,
     STAGE_SEQUENCE,
-    EXIT_KEYWORDS,
+    MAX_LIVE_MESSAGES,
+    TECH_STACK_INDEX,
+    EXIT_PATTERN,
     get_min_questions,
     get_max_questions
 )
 
 
+# Position of each stage in STAGE_SEQUENCE
+_STAGE_INDEX = {stage: index for index, stage in enumerate(STAGE_SEQUENCE)}
+_STAGE_LAST = len(STAGE_SEQUENCE) - 1
+
+# Information needed at each stage
+_STAGE_INFO_MAP = {
+    ConversationStage.COLLECT_NAME: "Full Name",
+    ConversationStage.COLLECT_EMAIL: "Email Address",
+    ConversationStage.COLLECT_PHONE: "Phone Number",
+    ConversationStage.COLLECT_EXPERIENCE: "Years of Experience",
+    ConversationStage.COLLECT_POSITION: "Desired Position",
+    ConversationStage.COLLECT_LOCATION: "Current Location",
+    ConversationStage.COLLECT_TECH_STACK: "Tech Stack",
+    ConversationStage.TECHNICAL_QUESTIONS: "Answer to technical question",
+    ConversationStage.CONCLUSION: "None - conversation ending",
+    ConversationStage.ENDED: "None - conversation ended"
+}
+
+
 class ConversationManager:
     """Manages conversation state, stages, and candidate information."""
     
+    _REQUIRED_FIELDS = ("name", "email", "phone", "experience", "position", "location", "tech_stack")
+    _REQUIRED_FIELDS_SET = frozenset(_REQUIRED_FIELDS)
+    
+    _FIELD_LABELS = (
+        ("name", "Full Name"),
+        ("email", "Email Address"),
+        ("phone", "Phone Number"),
+        ("experience", "Years of Experience"),
+        ("position", "Desired Position"),
+        ("location", "Current Location"),
+        ("tech_stack", "Tech Stack")
+    )
+    
     def __init__(self):
         """Initialize conversation manager."""
         self.stage = ConversationStage.GREETING
@@ -29,11 +66,15 @@ class ConversationManager:
         }
         self.tech_questions_asked: int = 0
         self.tech_questions_answers: List[Tuple[str, str]] = []  # List of (question, answer) tuples
-        self.conversation_history: List[Dict[str, str]] = []  # List of {role, content, timestamp}
+        self.tech_qa_messages: List[Dict[str, str]] = []  # Same pairs as Q/A chat messages for the LLM
+        # Most recent {role, content, timestamp} messages; the deque drops the oldest when full
+        self.conversation_history: Deque[Dict[str, Any]] = deque(maxlen=MAX_LIVE_MESSAGES)
         self.start_time: datetime = datetime.now()
         self.current_question: Optional[str] = None
         self.total_questions_to_ask: int = 0
         self.tech_stack_list: List[str] = []
+        self.known_techs: List[str] = []  # Entries found in SUPPORTED_TECH_STACKS
+        self._rng = random.Random()
     
     def add_message(self, role: str, content: str) -> None:
         """
@@ -46,25 +87,22 @@ class ConversationManager:
         self.conversation_history.append({
             "role": role,
             "content": content,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": time.time()  # Epoch seconds; formatted only when displayed
         })
     
     def get_next_stage(self) -> ConversationStage:
         """Get the next stage in the conversation sequence."""
-        try:
-            current_index = STAGE_SEQUENCE.index(self.stage)
-            if current_index < len(STAGE_SEQUENCE) - 1:
-                return STAGE_SEQUENCE[current_index + 1]
-            return ConversationStage.ENDED
-        except ValueError:
-            return ConversationStage.ENDED
+        current_index = _STAGE_INDEX.get(self.stage, _STAGE_LAST)
+        if current_index < _STAGE_LAST:
+            return STAGE_SEQUENCE[current_index + 1]
+        return ConversationStage.ENDED
     
     def move_to_next_stage(self) -> None:
         """Move to the next stage in the sequence."""
         self.stage = self.get_next_stage()
         
         # Special handling for technical questions stage
-        if self.stage == ConversationStage.TECHNICAL_QUESTIONS:
+        if self.stage is ConversationStage.TECHNICAL_QUESTIONS:
             self._prepare_technical_questions()
     
     def _prepare_technical_questions(self) -> None:
@@ -74,15 +112,29 @@ class ConversationManager:
         
         # Parse tech stack
         tech_stack_str = self.candidate_info["tech_stack"]
-        self.tech_stack_list = [t.strip() for t in tech_stack_str.split(",")]
+        self.tech_stack_list = [t.strip() for t in tech_stack_str.split(",") if t.strip()]
+        
+        # Cheap membership pre-filter so questions focus on recognized technologies
+        self.known_techs = [t for t in self.tech_stack_list if t.lower() in TECH_STACK_INDEX]
         
         # Determine number of questions (3-5)
-        import random
         min_q = get_min_questions()
         max_q = get_max_questions()
-        self.total_questions_to_ask = random.randint(min_q, max_q)
+        self.total_questions_to_ask = self._rng.randint(min_q, max_q)
         self.tech_questions_asked = 0
         self.tech_questions_answers = []
+        self.tech_qa_messages = []
+    
+    def get_question_tech_stack(self) -> str:
+        """
+        Get the tech stack to generate technical questions for.
+        
+        Returns:
+            Recognized technologies if any were given, otherwise the full tech stack
+        """
+        if self.known_techs:
+            return ", ".join(self.known_techs)
+        return self.candidate_info.get("tech_stack") or ""
     
     def update_candidate_info(self, field: str, value: str) -> None:
         """
@@ -92,8 +144,9 @@ class ConversationManager:
             field: Field name (name, email, phone, etc.)
             value: Field value
         """
-        if field in self.candidate_info:
-            self.candidate_info[field] = value
+        if field not in self._REQUIRED_FIELDS_SET:
+            return
+        self.candidate_info[field] = value
     
     def is_info_complete(self) -> bool:
         """
@@ -102,8 +155,8 @@ class ConversationManager:
         Returns:
             True if all fields are filled
         """
-        required_fields = ["name", "email", "phone", "experience", "position", "location", "tech_stack"]
-        return all(self.candidate_info.get(field) for field in required_fields)
+        info = self.candidate_info
+        return all(info[field] for field in self._REQUIRED_FIELDS)
     
     def get_collected_info_summary(self) -> str:
         """
@@ -112,27 +165,14 @@ class ConversationManager:
         Returns:
             Formatted string summary
         """
-        summary = "Collected Information:\n"
-        field_labels = {
-            "name": "Full Name",
-            "email": "Email Address",
-            "phone": "Phone Number",
-            "experience": "Years of Experience",
-            "position": "Desired Position",
-            "location": "Current Location",
-            "tech_stack": "Tech Stack"
-        }
-        
-        for key, label in field_labels.items():
-            value = self.candidate_info.get(key)
-            if value:
-                summary += f"- {label}: {value}\n"
-        
-        return summary
+        info = self.candidate_info
+        lines = ["Collected Information:"]
+        lines.extend(f"- {label}: {info[key]}" for key, label in self._FIELD_LABELS if info[key])
+        return "\n".join(lines) + "\n"
     
     def check_exit_keyword(self, message: str) -> bool:
         """
-        Check if message contains an exit keyword.
+        Check if message contains an exit keyword as a whole word (case-insensitive).
         
         Args:
             message: User message to check
@@ -140,8 +180,7 @@ class ConversationManager:
         Returns:
             True if exit keyword found
         """
-        message_lower = message.lower().strip()
-        return any(keyword in message_lower for keyword in EXIT_KEYWORDS)
+        return EXIT_PATTERN.search(message) is not None
     
     def get_stage_prompt_context(self) -> Dict[str, str]:
         """
@@ -158,19 +197,7 @@ class ConversationManager:
     
     def _get_needed_info_for_stage(self) -> str:
         """Get description of what information is needed for current stage."""
-        stage_info_map = {
-            ConversationStage.COLLECT_NAME: "Full Name",
-            ConversationStage.COLLECT_EMAIL: "Email Address",
-            ConversationStage.COLLECT_PHONE: "Phone Number",
-            ConversationStage.COLLECT_EXPERIENCE: "Years of Experience",
-            ConversationStage.COLLECT_POSITION: "Desired Position",
-            ConversationStage.COLLECT_LOCATION: "Current Location",
-            ConversationStage.COLLECT_TECH_STACK: "Tech Stack",
-            ConversationStage.TECHNICAL_QUESTIONS: "Answer to technical question",
-            ConversationStage.CONCLUSION: "None - conversation ending",
-            ConversationStage.ENDED: "None - conversation ended"
-        }
-        return stage_info_map.get(self.stage, "Unknown")
+        return _STAGE_INFO_MAP.get(self.stage, "Unknown")
     
     def add_technical_question_answer(self, question: str, answer: str) -> None:
         """
@@ -181,6 +208,8 @@ class ConversationManager:
             answer: Candidate's answer
         """
         self.tech_questions_answers.append((question, answer))
+        self.tech_qa_messages.append({"role": "user", "content": f"Q: {question}"})
+        self.tech_qa_messages.append({"role": "assistant", "content": f"A: {answer}"})
         self.tech_questions_asked += 1
     
     def has_more_technical_questions(self) -> bool:
@@ -202,11 +231,7 @@ class ConversationManager:
         Returns:
             Tuple of (current_step, total_steps)
         """
-        try:
-            current_index = STAGE_SEQUENCE.index(self.stage)
-            total_steps = len(STAGE_SEQUENCE) - 1  # Exclude ENDED stage
-            return current_index, total_steps
-        except ValueError:
-            return 0, len(STAGE_SEQUENCE) - 1
+        # Total steps excludes the ENDED stage
+        return _STAGE_INDEX.get(self.stage, 0), _STAGE_LAST
 
 
@@ -2,17 +2,40 @@
 LLM handler for OpenAI and Groq API integration.
 """
 import os
-from typing import List, Dict, Optional
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional
 from config.settings import get_api_key, get_llm_provider, get_model_name
 
 
+@lru_cache(maxsize=4)
+def _make_client(provider: str, api_key: str):
+    """
+    Create an API client, shared per (provider, api_key).
+    
+    The SDK clients keep their connections alive, so sharing one per process
+    pays TCP/TLS setup once rather than per handler instance.
+    
+    Args:
+        provider: 'openai' or 'groq'
+        api_key: API key for the provider
+        
+    Returns:
+        OpenAI or Groq client
+    """
+    if provider == "groq":
+        from groq import Groq
+        return Groq(api_key=api_key)
+    from openai import OpenAI
+    return OpenAI(api_key=api_key)
+
+
 class LLMHandler:
     """Handler for LLM API calls (OpenAI and Groq)."""
     
     def __init__(self):
         """Initialize LLM handler with API key and provider."""
         self.api_key = get_api_key()
-        self.provider = get_llm_provider().lower()
+        self.provider = get_llm_provider()
         self.model_name = get_model_name()
         
         if not self.api_key:
@@ -21,23 +44,35 @@ class LLMHandler:
                 "in environment variables or Streamlit secrets."
             )
         
+        # Greeting and exit messages don't depend on any input, so they are
+        # generated once and reused
+        self._cached_greeting: Optional[str] = None
+        self._cached_exit: Optional[str] = None
+        
         # Initialize client based on provider
-        if self.provider == "groq":
-            try:
-                from groq import Groq
-                self.client = Groq(api_key=self.api_key)
-            except ImportError:
+        try:
+            self.client = _make_client(self.provider, self.api_key)
+        except ImportError:
+            if self.provider == "groq":
                 raise ImportError(
                     "Groq library not installed. Install it with: pip install groq"
                 )
-        else:
-            try:
-                from openai import OpenAI
-                self.client = OpenAI(api_key=self.api_key)
-            except ImportError:
-                raise ImportError(
-                    "OpenAI library not installed. Install it with: pip install openai"
-                )
+            raise ImportError(
+                "OpenAI library not installed. Install it with: pip install openai"
+            )
+    
+    def clear_cached_messages(self) -> None:
+        """Forget the cached greeting and exit messages so they are generated again."""
+        self._cached_greeting = None
+        self._cached_exit = None
+    
+    def warm_up(self) -> None:
+        """Open the pooled API connection with a model listing, which isn't billed."""
+        try:
+            self.client.models.list()
+        except Exception:
+            # Connection problems are reported by the first real request
+            pass
     
     def generate_response(
         self,
@@ -59,42 +94,110 @@ class LLMHandler:
             Generated response text
         """
         try:
-            # Prepare messages with system prompt
-            formatted_messages = [{"role": "system", "content": system_prompt}]
-            formatted_messages.extend(messages)
-            
-            if self.provider == "groq":
-                # Groq API call
-                response = self.client.chat.completions.create(
-                    model=self.model_name,
-                    messages=formatted_messages,
-                    temperature=temperature,
-                    max_tokens=max_tokens
-                )
-            else:
-                # OpenAI API call
-                response = self.client.chat.completions.create(
-                    model=self.model_name,
-                    messages=formatted_messages,
-                    temperature=temperature,
-                    max_tokens=max_tokens
-                )
-            
-            return response.choices[0].message.content.strip()
+            return self._complete(messages, system_prompt, temperature, max_tokens)
+        except Exception as e:
+            return self._format_error(e)
+    
+    def _complete(
+        self,
+        messages: List[Dict[str, str]],
+        system_prompt: str,
+        temperature: float,
+        max_tokens: int
+    ) -> str:
+        """Call the chat completion API, letting errors propagate."""
+        # Prepare messages with system prompt
+        formatted_messages = self._format_messages(messages, system_prompt)
+        
+        if self.provider == "groq":
+            # Groq API call
+            response = self.client.chat.completions.create(
+                model=self.model_name,
+                messages=formatted_messages,
+                temperature=temperature,
+                max_tokens=max_tokens
+            )
+        else:
+            # OpenAI API call
+            response = self.client.chat.completions.create(
+                model=self.model_name,
+                messages=formatted_messages,
+                temperature=temperature,
+                max_tokens=max_tokens
+            )
         
+        return response.choices[0].message.content.strip()
+    
+    def generate_response_stream(
+        self,
+        messages: List[Dict[str, str]],
+        system_prompt: str,
+        temperature: float = 0.7,
+        max_tokens: int = 500
+    ) -> Iterator[str]:
+        """
+        Generate response from LLM, yielding text chunks as they arrive.
+        
+        Args:
+            messages: List of message dictionaries with 'role' and 'content'
+            system_prompt: System prompt to guide the conversation
+            temperature: Sampling temperature (0.0 to 2.0)
+            max_tokens: Maximum tokens in response
+            
+        Yields:
+            Response text chunks
+        """
+        try:
+            yield from self._stream(messages, system_prompt, temperature, max_tokens)
         except Exception as e:
-            error_msg = str(e)
-            # Don't expose API keys in error messages
-            if "api" in error_msg.lower() and "key" in error_msg.lower():
-                return "I'm having trouble connecting to the AI service. Please check your API key configuration."
-            return f"I encountered an error: {error_msg}. Please try again."
+            yield self._format_error(e)
+    
+    def _stream(
+        self,
+        messages: List[Dict[str, str]],
+        system_prompt: str,
+        temperature: float,
+        max_tokens: int
+    ) -> Iterator[str]:
+        """Stream chat completion chunks, letting errors propagate."""
+        formatted_messages = self._format_messages(messages, system_prompt)
+        
+        stream = self.client.chat.completions.create(
+            model=self.model_name,
+            messages=formatted_messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            stream=True
+        )
+        
+        for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+    
+    @staticmethod
+    def _format_messages(messages: List[Dict[str, str]], system_prompt: str) -> List[Dict[str, str]]:
+        """Prepend the system prompt to the conversation messages."""
+        formatted_messages = [{"role": "system", "content": system_prompt}]
+        formatted_messages.extend(messages)
+        return formatted_messages
+    
+    @staticmethod
+    def _format_error(error: Exception) -> str:
+        """Convert an API error into a user-facing message."""
+        error_msg = str(error)
+        # Don't expose API keys in error messages
+        if "api" in error_msg.lower() and "key" in error_msg.lower():
+            return "I'm having trouble connecting to the AI service. Please check your API key configuration."
+        return f"I encountered an error: {error_msg}. Please try again."
     
     def generate_technical_question(
         self,
         tech_stack: str,
         question_number: int,
         num_questions: int,
-        previous_qa: Optional[List[tuple]] = None
+        previous_qa: Optional[List[tuple]] = None,
+        messages: Optional[List[Dict[str, str]]] = None,
+        pending_question: Optional[str] = None
     ) -> str:
         """
         Generate a technical question based on tech stack.
@@ -104,46 +207,106 @@ class LLMHandler:
             question_number: Current question number (1-based)
             num_questions: Total number of questions
             previous_qa: List of (question, answer) tuples from previous questions
+            messages: Pre-built Q/A chat messages matching previous_qa; built
+                from previous_qa when omitted
+            pending_question: Question already asked but not yet answered,
+                which the new question must not repeat
             
         Returns:
             Generated technical question
         """
+        return self.generate_response(
+            **self._technical_question_request(
+                tech_stack, question_number, num_questions, previous_qa, messages, pending_question
+            )
+        )
+    
+    def complete_technical_question(
+        self,
+        tech_stack: str,
+        question_number: int,
+        num_questions: int,
+        previous_qa: Optional[List[tuple]] = None,
+        messages: Optional[List[Dict[str, str]]] = None,
+        pending_question: Optional[str] = None
+    ) -> str:
+        """Variant of generate_technical_question that raises API errors instead of returning error text."""
+        return self._complete(
+            **self._technical_question_request(
+                tech_stack, question_number, num_questions, previous_qa, messages, pending_question
+            )
+        )
+    
+    def stream_technical_question(
+        self,
+        tech_stack: str,
+        question_number: int,
+        num_questions: int,
+        previous_qa: Optional[List[tuple]] = None,
+        messages: Optional[List[Dict[str, str]]] = None,
+        pending_question: Optional[str] = None
+    ) -> Iterator[str]:
+        """Streaming variant of generate_technical_question."""
+        return self.generate_response_stream(
+            **self._technical_question_request(
+                tech_stack, question_number, num_questions, previous_qa, messages, pending_question
+            )
+        )
+    
+    def _technical_question_request(
+        self,
+        tech_stack: str,
+        question_number: int,
+        num_questions: int,
+        previous_qa: Optional[List[tuple]] = None,
+        messages: Optional[List[Dict[str, str]]] = None,
+        pending_question: Optional[str] = None
+    ) -> Dict:
+        """Build generate_response arguments for a technical question."""
         from prompts.system_prompts import get_tech_question_generator_prompt
         
         system_prompt = get_tech_question_generator_prompt(
             tech_stack=tech_stack,
             question_number=question_number,
             num_questions=num_questions,
-            previous_qa=previous_qa
+            previous_qa=previous_qa,
+            pending_question=pending_question
         )
         
-        # Use conversation history if available
-        messages = []
-        if previous_qa:
-            for q, a in previous_qa:
-                messages.append({"role": "user", "content": f"Q: {q}"})
-                messages.append({"role": "assistant", "content": f"A: {a}"})
+        # Use conversation history if available, unless the caller kept it pre-built
+        if messages is None:
+            messages = []
+            if previous_qa:
+                for q, a in previous_qa:
+                    messages.append({"role": "user", "content": f"Q: {q}"})
+                    messages.append({"role": "assistant", "content": f"A: {a}"})
         
-        return self.generate_response(
-            messages=messages,
-            system_prompt=system_prompt,
-            temperature=0.8,  # Slightly higher for more creative questions
-            max_tokens=200
-        )
+        return {
+            "messages": messages,
+            "system_prompt": system_prompt,
+            "temperature": 0.8,  # Slightly higher for more creative questions
+            "max_tokens": 200
+        }
     
     def generate_greeting(self) -> str:
-        """Generate initial greeting message."""
+        """Generate initial greeting message (generated once, then reused)."""
+        if self._cached_greeting is None:
+            try:
+                self._cached_greeting = self._complete(**self._greeting_request())
+            except Exception as e:
+                return self._format_error(e)
+        return self._cached_greeting
+    
+    def _greeting_request(self) -> Dict:
+        """Build generate_response arguments for the greeting."""
         from prompts.system_prompts import get_greeting_prompt
         
-        system_prompt = get_greeting_prompt()
-        messages = []
-        
-        return self.generate_response(
-            messages=messages,
-            system_prompt=system_prompt,
-            temperature=0.7,
-            max_tokens=150
-        )
+        return {
+            "messages": [],
+            "system_prompt": get_greeting_prompt(),
+            "temperature": 0.7,
+            "max_tokens": 150
+        }
     
     def generate_info_collector_response(
         self,
@@ -162,18 +325,37 @@ class LLMHandler:
         Returns:
             Bot response
         """
-        from prompts.system_prompts import get_information_collector_prompt
-        
-        system_prompt = get_information_collector_prompt(stage, collected_info)
-        messages = [{"role": "user", "content": user_message}]
-        
         return self.generate_response(
-            messages=messages,
-            system_prompt=system_prompt,
-            temperature=0.7,
-            max_tokens=200
+            **self._info_collector_request(stage, user_message, collected_info)
         )
     
+    def stream_info_collector_response(
+        self,
+        stage: str,
+        user_message: str,
+        collected_info: Dict[str, str]
+    ) -> Iterator[str]:
+        """Streaming variant of generate_info_collector_response."""
+        return self.generate_response_stream(
+            **self._info_collector_request(stage, user_message, collected_info)
+        )
+    
+    def _info_collector_request(
+        self,
+        stage: str,
+        user_message: str,
+        collected_info: Dict[str, str]
+    ) -> Dict:
+        """Build generate_response arguments for an information collection reply."""
+        from prompts.system_prompts import get_information_collector_prompt
+        
+        return {
+            "messages": [{"role": "user", "content": user_message}],
+            "system_prompt": get_information_collector_prompt(stage, collected_info),
+            "temperature": 0.7,
+            "max_tokens": 200
+        }
+    
     def generate_fallback_response(
         self,
         stage: str,
@@ -213,30 +395,55 @@ class LLMHandler:
         Returns:
             Conclusion message
         """
+        return self.generate_response(**self._conclusion_request(collected_info))
+    
+    def stream_conclusion(self, collected_info: Dict[str, str]) -> Iterator[str]:
+        """Streaming variant of generate_conclusion."""
+        return self.generate_response_stream(**self._conclusion_request(collected_info))
+    
+    def _conclusion_request(self, collected_info: Dict[str, str]) -> Dict:
+        """Build generate_response arguments for the conclusion."""
         from prompts.system_prompts import get_conclusion_prompt
         
-        system_prompt = get_conclusion_prompt(collected_info)
-        messages = []
-        
-        return self.generate_response(
-            messages=messages,
-            system_prompt=system_prompt,
-            temperature=0.7,
-            max_tokens=300
-        )
+        return {
+            "messages": [],
+            "system_prompt": get_conclusion_prompt(collected_info),
+            "temperature": 0.7,
+            "max_tokens": 300
+        }
     
     def generate_exit_message(self) -> str:
-        """Generate exit message."""
-        from prompts.system_prompts import get_exit_prompt
+        """Generate exit message (generated once, then reused)."""
+        if self._cached_exit is None:
+            try:
+                self._cached_exit = self._complete(**self._exit_request())
+            except Exception as e:
+                return self._format_error(e)
+        return self._cached_exit
+    
+    def stream_exit_message(self) -> Iterator[str]:
+        """Streaming variant of generate_exit_message."""
+        if self._cached_exit is not None:
+            yield self._cached_exit
+            return
         
-        system_prompt = get_exit_prompt()
-        messages = []
+        chunks = []
+        try:
+            for chunk in self._stream(**self._exit_request()):
+                chunks.append(chunk)
+                yield chunk
+        except Exception as e:
+            yield self._format_error(e)
+            return
+        self._cached_exit = "".join(chunks).strip()
+    
+    def _exit_request(self) -> Dict:
+        """Build generate_response arguments for the exit message."""
+        from prompts.system_prompts import get_exit_prompt
         
-        return self.generate_response(
-            messages=messages,
-            system_prompt=system_prompt,
-            temperature=0.7,
-            max_tokens=150
-        )
-
-
+        return {
+            "messages": [],
+            "system_prompt": get_exit_prompt(),
+            "temperature": 0.7,
+            "max_tokens": 150
+        }
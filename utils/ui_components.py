@@ -2,29 +2,51 @@
 Reusable Streamlit UI components.
 """
 import streamlit as st
-from typing import Dict, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional, Union
 from datetime import datetime
 
 
-def display_chat_message(role: str, content: str, timestamp: Optional[str] = None) -> None:
+# Sidebar labels for candidate information fields
+_SIDEBAR_FIELD_LABELS = {
+    "name": "👤 Full Name",
+    "email": "📧 Email",
+    "phone": "📱 Phone",
+    "experience": "💼 Experience",
+    "position": "🎯 Position",
+    "location": "📍 Location",
+    "tech_stack": "⚙️ Tech Stack"
+}
+
+
+def display_chat_message(role: str, content: str, timestamp: Optional[Union[float, str]] = None) -> None:
     """
     Display a chat message in the Streamlit interface.
     
     Args:
         role: 'user' or 'assistant'
         content: Message content
-        timestamp: Optional timestamp string
+        timestamp: Optional epoch seconds or ISO timestamp string
+    """
+    with st.chat_message("user" if role == "user" else "assistant"):
+        st.write(content)
+        if timestamp:
+            st.caption(f"🕒 {_format_timestamp(timestamp)}")
+
+
+def display_chat_history(messages: List[Dict[str, str]]) -> None:
+    """
+    Display the full chat history.
+    
+    Streamlit rebuilds the page on every rerun, so every message has to be
+    emitted again; per-message formatting is kept cheap instead.
+    
+    Args:
+        messages: List of {role, content, timestamp} dictionaries
     """
-    if role == "user":
-        with st.chat_message("user"):
-            st.write(content)
-            if timestamp:
-                st.caption(f"🕒 {_format_timestamp(timestamp)}")
-    else:
-        with st.chat_message("assistant"):
-            st.write(content)
-            if timestamp:
-                st.caption(f"🕒 {_format_timestamp(timestamp)}")
+    with st.container():
+        for message in messages:
+            display_chat_message(message["role"], message["content"], message.get("timestamp"))
 
 
 def display_sidebar_info(candidate_info: Dict[str, Optional[str]]) -> None:
@@ -34,28 +56,12 @@ def display_sidebar_info(candidate_info: Dict[str, Optional[str]]) -> None:
     Args:
         candidate_info: Dictionary of candidate information
     """
-    st.sidebar.header("📋 Collected Information")
-    
-    field_labels = {
-        "name": "👤 Full Name",
-        "email": "📧 Email",
-        "phone": "📱 Phone",
-        "experience": "💼 Experience",
-        "position": "🎯 Position",
-        "location": "📍 Location",
-        "tech_stack": "⚙️ Tech Stack"
-    }
-    
-    for key, label in field_labels.items():
-        value = candidate_info.get(key)
-        if value:
-            st.sidebar.markdown(f"**{label}**")
-            st.sidebar.write(value)
-            st.sidebar.markdown("---")
-        else:
-            st.sidebar.markdown(f"**{label}**")
-            st.sidebar.write("_Not collected yet_")
-            st.sidebar.markdown("---")
+    # Render the whole section in one call instead of three per field
+    parts = ["## 📋 Collected Information\n"]
+    for key, label in _SIDEBAR_FIELD_LABELS.items():
+        value = candidate_info.get(key) or "_Not collected yet_"
+        parts.append(f"**{label}**\n\n{value}\n\n---\n")
+    st.sidebar.markdown("\n".join(parts))
 
 
 def display_progress_indicator(current_stage: str, current_step: int, total_steps: int) -> None:
@@ -77,15 +83,29 @@ def display_progress_indicator(current_stage: str, current_step: int, total_step
     st.sidebar.markdown("---")
 
 
+@st.cache_data
+def _load_css(path: str) -> str:
+    """
+    Read a CSS file once per process.
+    
+    Args:
+        path: Path to the CSS file
+        
+    Returns:
+        CSS file contents
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
 def apply_custom_css() -> None:
     """Load and apply custom CSS styling."""
     import os
     css_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "assets", "styles.css")
     try:
         if os.path.exists(css_path):
-            with open(css_path, "r", encoding="utf-8") as f:
-                css = f.read()
-                st.markdown(f"<style>{css}</style>", unsafe_allow_html=True)
+            # Injected on every rerun, since Streamlit drops elements that aren't re-emitted
+            st.markdown(f"<style>{_load_css(css_path)}</style>", unsafe_allow_html=True)
     except Exception:
         # CSS file not found or error reading, use default styling
         pass
@@ -121,34 +141,50 @@ def display_info_message(message: str) -> None:
     st.info(f"ℹ️ {message}")
 
 
-def display_tech_stack_reference() -> None:
-    """Display tech stack reference in sidebar."""
+@lru_cache(maxsize=None)
+def _tech_stack_markdown() -> str:
+    """
+    Build the tech stack reference as a single markdown block.
+    
+    Returns:
+        Markdown string listing supported technologies by category
+    """
     from config.settings import SUPPORTED_TECH_STACKS
     
+    parts = []
+    for category, techs in SUPPORTED_TECH_STACKS.items():
+        parts.append(f"**{category}**\n\n{', '.join(techs[:10])}\n")  # Show first 10
+        if len(techs) > 10:
+            parts.append(f"<small>... and {len(techs) - 10} more</small>\n")
+        parts.append("---\n")
+    return "\n".join(parts)
+
+
+def display_tech_stack_reference() -> None:
+    """Display tech stack reference in sidebar."""
     with st.sidebar.expander("📚 Supported Tech Stacks"):
-        for category, techs in SUPPORTED_TECH_STACKS.items():
-            st.markdown(f"**{category}**")
-            st.write(", ".join(techs[:10]))  # Show first 10
-            if len(techs) > 10:
-                st.caption(f"... and {len(techs) - 10} more")
-            st.markdown("---")
+        st.markdown(_tech_stack_markdown(), unsafe_allow_html=True)
 
 
-def _format_timestamp(timestamp: str) -> str:
+@lru_cache(maxsize=2048)
+def _format_timestamp(timestamp: Union[float, str]) -> str:
     """
     Format timestamp for display.
     
     Args:
-        timestamp: ISO format timestamp string
+        timestamp: Epoch seconds or ISO format timestamp string
         
     Returns:
         Formatted timestamp string
     """
     try:
-        dt = datetime.fromisoformat(timestamp)
+        if isinstance(timestamp, (int, float)):
+            dt = datetime.fromtimestamp(timestamp)
+        else:
+            dt = datetime.fromisoformat(timestamp)
         return dt.strftime("%H:%M:%S")
     except Exception:
-        return timestamp
+        return str(timestamp)
 
 
 def display_loading_indicator() -> None:
@@ -6,6 +6,25 @@ from typing import Tuple
 from email_validator import validate_email, EmailNotValidError
 import phonenumbers
 from phonenumbers import NumberParseException
+from config.settings import TECH_STACK_INDEX
+
+
+# Precompiled patterns used by the validators
+_NAME_RE = re.compile(r"^[a-zA-Z\s\.\-\']+$")
+_EXP_WORD_RE = re.compile(r'\s*(years?|yrs?|year|yr)\s*')
+_DIGITS_RE = re.compile(r'\d+')
+
+# Number words accepted for years of experience
+_WORD_NUM = {
+    'zero': 0, 'one': 1, 'two': 2, 'three': 3, 'four': 4,
+    'five': 5, 'six': 6, 'seven': 7, 'eight': 8, 'nine': 9,
+    'ten': 10, 'eleven': 11, 'twelve': 12, 'thirteen': 13,
+    'fourteen': 14, 'fifteen': 15, 'twenty': 20, 'thirty': 30
+}
+_WORD_NUM_RE = re.compile(r'\b(' + '|'.join(_WORD_NUM) + r')\b')
+
+# Separators accepted between technologies in a tech stack
+_TECH_SEPARATOR_RE = re.compile(r"[,;]")
 
 
 class Validator:
@@ -35,8 +54,7 @@ class Validator:
             return False, "Name must be at least 2 characters long."
         
         # Allow letters, spaces, periods, hyphens, apostrophes
-        pattern = r"^[a-zA-Z\s\.\-\']+$"
-        if not re.match(pattern, name):
+        if not _NAME_RE.match(name):
             return False, "Name can only contain letters, spaces, periods, hyphens, and apostrophes."
         
         # Normalize: remove extra spaces, capitalize properly
@@ -83,9 +101,6 @@ class Validator:
         
         phone = phone.strip()
         
-        # Remove common separators for parsing
-        phone_clean = re.sub(r'[\s\-\(\)\.]', '', phone)
-        
         try:
             # Try to parse the phone number
             # Default to US if no country code provided
@@ -121,28 +136,21 @@ class Validator:
         if not experience or not isinstance(experience, str):
             return False, "Experience cannot be empty."
         
-        experience = experience.strip().lower()
+        text = experience.strip().lower()
         
         # Remove common words
-        experience = re.sub(r'\s*(years?|yrs?|year|yr)\s*', '', experience)
+        experience = _EXP_WORD_RE.sub('', text)
         
         # Try to extract number
-        numbers = re.findall(r'\d+', experience)
+        numbers = _DIGITS_RE.findall(experience)
         
         if not numbers:
-            # Try word-to-number conversion for common cases
-            word_to_num = {
-                'zero': 0, 'one': 1, 'two': 2, 'three': 3, 'four': 4,
-                'five': 5, 'six': 6, 'seven': 7, 'eight': 8, 'nine': 9,
-                'ten': 10, 'eleven': 11, 'twelve': 12, 'thirteen': 13,
-                'fourteen': 14, 'fifteen': 15, 'twenty': 20, 'thirty': 30
-            }
-            for word, num in word_to_num.items():
-                if word in experience:
-                    years = num
-                    break
-            else:
+            # Try word-to-number conversion for common cases; match on the text
+            # before unit words (and their surrounding spaces) were removed
+            match = _WORD_NUM_RE.search(text)
+            if not match:
                 return False, "Please provide a valid number of years (0-50)."
+            years = _WORD_NUM[match.group(1)]
         else:
             years = int(numbers[0])
         
@@ -226,8 +234,18 @@ class Validator:
         if len(tech_stack) < 2:
             return False, "Tech stack must be at least 2 characters long."
         
-        # Normalize: remove extra spaces, handle comma-separated values
-        tech_list = [t.strip() for t in tech_stack.split(',') if t.strip()]
+        # Single technology (common case): skip the split/join
+        if ',' not in tech_stack and ';' not in tech_stack:
+            tech = " ".join(tech_stack.split())
+            return True, TECH_STACK_INDEX.get(tech.lower(), tech)
+        
+        # Normalize: remove extra spaces, handle comma/semicolon-separated values,
+        # and use canonical casing for known technologies
+        tech_list = []
+        for tech in _TECH_SEPARATOR_RE.split(tech_stack):
+            tech = " ".join(tech.split())
+            if tech:
+                tech_list.append(TECH_STACK_INDEX.get(tech.lower(), tech))
         normalized = ", ".join(tech_list)
         
         return True, normalized